@@ -20,6 +20,11 @@ class AIRL(GAIL):
             The number of experiences to sample in each discriminator update.
         replay_start_size (int): Number of experiences in replay buffer when training begins.
         update_frequency (int): Number of base_agent update per discriminator update
+        update_batches (int):
+            Number of discriminator minibatches merged into one update.
+            The discriminator is updated once every
+            update_frequency * update_batches base_agent updates
+            with update_batches * minibatch_size experiences.
     """
 
     def __init__(self,
@@ -27,6 +32,7 @@ class AIRL(GAIL):
                  minibatch_size=32,
                  replay_start_size=5000,
                  update_frequency=10,
+                 update_batches=1,
                  ):
         # objects
         self.base_agent = base_agent
@@ -40,13 +46,15 @@ class AIRL(GAIL):
         self.minibatch_size = minibatch_size
         self.replay_start_size = replay_start_size
         self.update_frequency = update_frequency
+        self.update_batches = update_batches
         self._train_count = 0
 
     def train(self):
+        self._train_count += 1
         # train discriminator
         if self.should_train():
             samples, expert_samples = self.replay_buffer.sample_both(
-                self.minibatch_size)
+                self.minibatch_size * self.update_batches)
             states, actions, _, next_states, _, _ = samples
             exp_states, exp_actions, _, exp_next_states, _, _ = expert_samples
 
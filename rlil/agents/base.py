@@ -66,6 +66,7 @@ class LazyAgent(ABC):
         self._evaluation = evaluation
         self._store_samples = store_samples
         self.replay_buffer = None
+        self._generator = None
         # for N step replay buffer
         self._n_step, self._discount_factor = get_n_step()
         if self._evaluation:
@@ -76,6 +77,16 @@ class LazyAgent(ABC):
             1e7, env, n_step=self._n_step,
             discount_factor=self._discount_factor)
 
+    def set_generator(self, generator):
+        """
+        Set a torch.Generator for sampling actions.
+        Workers call it so that each worker samples from its own
+        random number generator.
+        Args:
+            generator (torch.Generator)
+        """
+        self._generator = generator
+
     def act(self, states, reward):
         """
         In the act function, the lazy_agent put a sample 
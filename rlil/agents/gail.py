@@ -18,6 +18,11 @@ class GAIL(Agent):
             The number of experiences to sample in each discriminator update.
         replay_start_size (int): Number of experiences in replay buffer when training begins.
         update_frequency (int): Number of base_agent update per discriminator update
+        update_batches (int):
+            Number of discriminator minibatches merged into one update.
+            The discriminator is updated once every
+            update_frequency * update_batches base_agent updates
+            with update_batches * minibatch_size experiences.
     """
 
     def __init__(self,
@@ -25,6 +30,7 @@ class GAIL(Agent):
                  minibatch_size=32,
                  replay_start_size=5000,
                  update_frequency=10,
+                 update_batches=1,
                  ):
         # objects
         self.base_agent = base_agent
@@ -32,12 +38,29 @@ class GAIL(Agent):
         self.discriminator = self.replay_buffer.discriminator
         self.writer = get_writer()
         self.device = get_device()
-        self.discrim_criterion = nn.BCELoss()
         # hyperparameters
         self.minibatch_size = minibatch_size
         self.replay_start_size = replay_start_size
         self.update_frequency = update_frequency
+        self.update_batches = update_batches
         self._train_count = 0
+        # discriminator targets, fake: 1 and real: 0.
+        num_fake, num_real = self.replay_buffer.sample_both_sizes(
+            minibatch_size * update_batches)
+        self._discrim_targets = torch.cat(
+            (torch.ones(num_fake, 1, device=self.device),
+             torch.zeros(num_real, 1, device=self.device)), dim=0)
+        # the weighted sum over the stacked batch is
+        # the sum of the mean fake loss and the mean real loss
+        discrim_weights = torch.cat(
+            (torch.full((num_fake, 1), 1 / num_fake, device=self.device),
+             torch.full((num_real, 1), 1 / num_real, device=self.device)),
+            dim=0)
+        self.discrim_criterion = nn.BCEWithLogitsLoss(weight=discrim_weights,
+                                                      reduction="sum")
+        # stacked [fake; real] discriminator inputs, allocated at the first update
+        self._num_fake = num_fake
+        self._discrim_inputs = None
 
     def act(self, *args, **kwargs):
         return self.base_agent.act(*args, **kwargs)
@@ -47,28 +70,44 @@ class GAIL(Agent):
         # train discriminator
         if self.should_train():
             samples, expert_samples = self.replay_buffer.sample_both(
-                self.minibatch_size)
+                self.minibatch_size * self.update_batches)
             states, actions, _, _, _, _ = samples
             exp_states, exp_actions, _, _, _, _ = expert_samples
 
-            fake = self.discriminator(
-                torch.cat((states.features, actions.features), dim=1))
-            real = self.discriminator(
-                torch.cat((exp_states.features, exp_actions.features), dim=1))
-            discrim_loss = self.discrim_criterion(fake, torch.ones_like(fake)) + \
-                self.discrim_criterion(real, torch.zeros_like(real))
+            # run the discriminator once on the stacked [fake; real] batch
+            num_fake = self._num_fake
+            state_dim = states.features.shape[1]
+            if self._discrim_inputs is None:
+                self._discrim_inputs = torch.empty(
+                    (len(self._discrim_targets),
+                     state_dim + actions.features.shape[1]),
+                    device=self.device)
+            # reinforce runs the backward pass before the next overwrite
+            inputs = self._discrim_inputs
+            inputs[:num_fake, :state_dim].copy_(states.features)
+            inputs[:num_fake, state_dim:].copy_(actions.features)
+            inputs[num_fake:, :state_dim].copy_(exp_states.features)
+            inputs[num_fake:, state_dim:].copy_(exp_actions.features)
+            with nn.autocast(self.device):
+                outputs = self.discriminator(inputs)
+            outputs = outputs.float()
+            fake, real = outputs[:num_fake], outputs[num_fake:]
+            discrim_loss = self.discrim_criterion(
+                outputs, self._discrim_targets)
             self.discriminator.reinforce(discrim_loss)
 
             # additional debugging info
-            self.writer.add_scalar('gail/fake', fake.mean())
-            self.writer.add_scalar('gail/real', real.mean())
+            self.writer.add_scalar('gail/fake', fake.sigmoid().mean())
+            self.writer.add_scalar('gail/real', real.sigmoid().mean())
 
         # train base_agent
         self.base_agent.train()
 
     def should_train(self):
-        return len(self.replay_buffer) > self.replay_start_size and \
-            self._train_count % self.update_frequency == 0
+        # check the local counter first to skip the replay buffer size query
+        return self._train_count % \
+            (self.update_frequency * self.update_batches) == 0 and \
+            len(self.replay_buffer) > self.replay_start_size
 
     def make_lazy_agent(self, *args, **kwargs):
         return self.base_agent.make_lazy_agent(*args, **kwargs)
@@ -5,7 +5,7 @@ from rlil.environments import Action
 from rlil.initializer import (
     get_device, get_writer, get_replay_buffer, use_apex)
 from rlil.memory import ExperienceReplayBuffer
-from rlil.nn import weighted_mse_loss
+from rlil.nn import weighted_mse_loss, autocast
 from rlil.utils import Samples
 from .base import Agent, LazyAgent
 
@@ -81,7 +81,8 @@ class SAC(Agent):
              weights, indexes) = self.replay_buffer.sample(self.minibatch_size)
 
             # Target actions come from *current* policy
-            _actions, _log_probs = self.policy.no_grad(states)
+            with autocast(self.device):
+                _actions, _log_probs = self.policy.no_grad(states)
             # compute targets for Q and V
             q_targets = rewards + self.discount_factor * \
                 self.v.target(next_states)
@@ -105,7 +106,8 @@ class SAC(Agent):
             self.replay_buffer.update_priorities(indexes, td_errors.cpu())
 
             # update policy
-            _actions2, _log_probs2 = self.policy(states)
+            with autocast(self.device):
+                _actions2, _log_probs2 = self.policy(states)
             loss = (-self.q_1(states, Action(_actions2)) +
                     self.temperature * _log_probs2).mean()
             self.policy.reinforce(loss)
@@ -176,7 +178,8 @@ class SACLazyAgent(LazyAgent):
             if self._evaluation:
                 outputs = self._policy_model(states, return_mean=True)
             else:
-                outputs = self._policy_model(states)[0]
+                outputs = self._policy_model(
+                    states, generator=self._generator)[0]
             self._actions = Action(outputs).to("cpu")
         return self._actions
 
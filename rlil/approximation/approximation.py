@@ -3,7 +3,7 @@ import torch
 from torch.nn import utils
 from .target import TrivialTarget
 from .checkpointer import PeriodicCheckpointer
-from rlil.initializer import get_writer
+from rlil.initializer import get_writer, use_compile
 
 DEFAULT_CHECKPOINT_FREQUENCY = 200
 
@@ -67,6 +67,7 @@ class Approximation():
         self._clip_grad = clip_grad
         self._writer = get_writer()
         self._name = name
+        self._compiled_model = None
 
         if checkpointer is None:
             checkpointer = PeriodicCheckpointer(DEFAULT_CHECKPOINT_FREQUENCY)
@@ -81,12 +82,12 @@ class Approximation():
         '''
         Run a forward pass of the model.
         '''
-        return self.model(*inputs)
+        return self._forward_model()(*inputs)
 
     def no_grad(self, *inputs):
         '''Run a forward pass of the model in no_grad mode.'''
         with torch.no_grad():
-            return self.model(*inputs)
+            return self._forward_model()(*inputs)
 
     def eval(self, *inputs):
         '''
@@ -99,11 +100,25 @@ class Approximation():
             # switch to eval mode
             self.model.eval()
             # run forward pass
-            result = self.model(*inputs)
+            result = self._forward_model()(*inputs)
             # change to original mode
             self.model.train(mode)
             return result
 
+    def _forward_model(self):
+        '''
+        Return the model compiled by torch.compile if rlil.initializer.use_compile().
+        self.model itself is not replaced, so that it can be deepcopied
+        for lazy agents and saved by the checkpointer.
+        '''
+        if not use_compile():
+            return self.model
+        # recompile if self.model is replaced, e.g. by agent.load()
+        if self._compiled_model is None or \
+                self._compiled_model._orig_mod is not self.model:
+            self._compiled_model = torch.compile(self.model)
+        return self._compiled_model
+
     def target(self, *inputs):
         '''Run a forward pass of the target network.'''
         return self._target(*inputs)
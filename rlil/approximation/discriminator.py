@@ -20,8 +20,9 @@ class Discriminator(Approximation):
         )
 
     def expert_reward(self, features):
-        rew = torch.log(self.model(features)) - \
-            torch.log(1 - self.model(features))
+        # the model outputs logits, and
+        # log(sigmoid(x)) - log(1 - sigmoid(x)) == x
+        rew = self.model(features)
         return rew.squeeze().detach()
 
 
@@ -20,8 +20,10 @@ class PolyakTarget(TargetNetwork):
         self._target = copy.deepcopy(model)
 
     def update(self):
-        for target_param, source_param in zip(self._target.parameters(), self._source.parameters()):
-            target_param.data.copy_(
-                target_param.data * (1.0 - self._rate) +
-                source_param.data * self._rate
-            )
+        # update all the parameters with a few multi-tensor kernels
+        with torch.no_grad():
+            target_params = list(self._target.parameters())
+            source_params = list(self._source.parameters())
+            torch._foreach_mul_(target_params, 1.0 - self._rate)
+            torch._foreach_add_(target_params, source_params,
+                                alpha=self._rate)
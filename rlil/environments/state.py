@@ -75,7 +75,11 @@ class State:
                    info=None,
                    device="cpu",
                    dtype=np.float32):
-        raw = torch.as_tensor(np_raw.astype(dtype), device=device)
+        '''
+        The features share memory with np_raw if np_raw already has dtype
+        and device is cpu. Don't modify np_raw while the state is in use.
+        '''
+        raw = torch.as_tensor(np_raw.astype(dtype, copy=False), device=device)
         mask = ~torch.tensor(np_done, dtype=torch.bool,
                              device=device).reshape(-1) if np_done is not None else None
         info = info if info is not None else [None] * len(raw)
@@ -1,6 +1,7 @@
 import numpy as np
 from rlil.utils.writer import ExperimentWriter
-from rlil.initializer import get_logger, get_writer, set_writer, set_logger, set_seed
+from rlil.initializer import (get_logger, get_writer, set_writer,
+                              set_logger, set_seed, is_on_policy_mode)
 from rlil.samplers import AsyncSampler
 from .trainer import Trainer
 import os
@@ -22,6 +23,7 @@ class Experiment:
             trains_per_episode=20,
             num_workers=1,
             num_workers_eval=1,
+            pipelining=False,
             max_sample_frames=np.inf,
             max_sample_episodes=np.inf,
             max_train_steps=np.inf,
@@ -68,7 +70,11 @@ class Experiment:
         # start training
         agent = agent_fn(env)
 
-        sampler = AsyncSampler(env, num_workers=num_workers) \
+        # on-policy agents need samples from the latest policy
+        assert not (pipelining and is_on_policy_mode()), \
+            "pipelining is not supported with on-policy agents"
+        sampler = AsyncSampler(env, num_workers=num_workers,
+                               pipelining=pipelining) \
             if num_workers > 0 else None
         eval_sampler = AsyncSampler(env, num_workers=num_workers_eval) \
             if num_workers_eval > 0 else None
@@ -33,6 +33,9 @@ _DEVICE = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
 def set_device(device):
     global _DEVICE
     _DEVICE = device
+    if torch.device(device).type == "cuda":
+        # input shapes are fixed during training
+        torch.backends.cudnn.benchmark = True
 
 
 def get_device():
@@ -156,3 +159,44 @@ def disable_apex():
 def use_apex():
     global _USE_APEX
     return _USE_APEX
+
+
+_USE_COMPILE = False
+
+
+def enable_compile():
+    global _USE_COMPILE
+    assert hasattr(torch, "compile"), "torch.compile requires torch>=2.0"
+    _USE_COMPILE = True
+    print("-----USE_COMPILE: {}-----".format(_USE_COMPILE))
+
+
+def disable_compile():
+    global _USE_COMPILE
+    _USE_COMPILE = False
+    print("-----USE_COMPILE: {}-----".format(_USE_COMPILE))
+
+
+def use_compile():
+    global _USE_COMPILE
+    return _USE_COMPILE
+
+
+_USE_AMP = False
+
+
+def enable_amp():
+    global _USE_AMP
+    _USE_AMP = True
+    print("-----USE_AMP: {}-----".format(_USE_AMP))
+
+
+def disable_amp():
+    global _USE_AMP
+    _USE_AMP = False
+    print("-----USE_AMP: {}-----".format(_USE_AMP))
+
+
+def use_amp():
+    global _USE_AMP
+    return _USE_AMP
@@ -18,7 +18,8 @@ class AirlWrapper(GailWrapper):
                  value_fn,
                  policy,
                  feature_nw=None,
-                 discount_factor=1.0):
+                 discount_factor=1.0,
+                 expert_ratio=0.5):
         """
         Args:
             buffer (rlil.memory.ExperienceReplayBuffer): 
@@ -32,6 +33,8 @@ class AirlWrapper(GailWrapper):
             policy (rlil.policies):
                 A policy approximation
             feature_nw (rlil.approximation.FeatureNetwork)
+            expert_ratio (float):
+                Fraction of expert samples in a batch of sample_both.
         """
         self.buffer = buffer
         self.expert_buffer = expert_buffer
@@ -41,6 +44,8 @@ class AirlWrapper(GailWrapper):
         self.policy = policy
         self.feature_nw = feature_nw
         self.discount_factor = discount_factor
+        assert 0 < expert_ratio < 1, "expert_ratio must be in (0, 1)"
+        self.expert_ratio = expert_ratio
 
     def sample(self, batch_size):
         # replace the rewards with gail rewards
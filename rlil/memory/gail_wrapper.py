@@ -13,7 +13,7 @@ class GailWrapper(BaseBufferWrapper):
     A wrapper of ExperienceReplayBuffer for rlil.agents.GAIL.
     """
 
-    def __init__(self, buffer, expert_buffer, discriminator):
+    def __init__(self, buffer, expert_buffer, discriminator, expert_ratio=0.5):
         """
         Args:
             buffer (rlil.memory.ExperienceReplayBuffer): 
@@ -22,11 +22,15 @@ class GailWrapper(BaseBufferWrapper):
                 A replay_buffer with expert trajectories.
             discriminator (rlil.approximation.Discriminator):
                 A discriminator approximation.
+            expert_ratio (float):
+                Fraction of expert samples in a batch of sample_both.
         """
         self.buffer = buffer
         self.expert_buffer = expert_buffer
         self.device = get_device()
         self.discriminator = discriminator
+        assert 0 < expert_ratio < 1, "expert_ratio must be in (0, 1)"
+        self.expert_ratio = expert_ratio
 
     def sample(self, batch_size):
         # replace the rewards with gail rewards
@@ -38,11 +42,21 @@ class GailWrapper(BaseBufferWrapper):
         return (states, actions, rewards, next_states, weights, indexes)
 
     def sample_both(self, batch_size):
-        batch_size = int(batch_size / 2)
-        samples = self.buffer.sample(batch_size)
-        expert_samples = self.expert_buffer.sample(batch_size)
+        # the sampled and the expert trajectories are kept in separate buffers
+        num_samples, num_expert_samples = self.sample_both_sizes(batch_size)
+        samples = self.buffer.sample(num_samples)
+        expert_samples = self.expert_buffer.sample(num_expert_samples)
         return samples, expert_samples
 
+    def sample_both_sizes(self, batch_size):
+        # return the number of sampled and expert experiences of sample_both
+        num_expert_samples = int(round(batch_size * self.expert_ratio))
+        num_samples = batch_size - num_expert_samples
+        assert num_samples > 0 and num_expert_samples > 0, \
+            "sample_both({}) with expert_ratio={} leaves a buffer unsampled" \
+            .format(batch_size, self.expert_ratio)
+        return num_samples, num_expert_samples
+
     def get_all_transitions(self):
         # return the sampled trajectories
         # not including expert trajectories
@@ -51,7 +51,7 @@ class ExperienceReplayBuffer(BaseReplayBuffer):
     def __init__(self,
                  size, env,
                  prioritized=False, alpha=0.6, beta=0.4, eps=1e-4,
-                 n_step=1, discount_factor=0.95):
+                 n_step=1, discount_factor=0.95, block_len=1, block_gap=None):
         """
         Args:
             size (int): The capacity of replay buffer.
@@ -67,6 +67,14 @@ class ExperienceReplayBuffer(BaseReplayBuffer):
                in LazyAgent objects, not in Agent objects.
             discount_factor (float, optional): 
                 Discount factor for Nstep experience replay.
+            block_len (int, optional):
+                If block_len > 1, self.sample() draws batch_size / block_len
+                blocks of block_len consecutive transitions instead of
+                i.i.d. transitions. Not supported with prioritized=True.
+            block_gap (int, optional):
+                If specified, the sampled blocks don't overlap and are at least
+                block_gap transitions apart, as long as the buffer has room
+                for them. Otherwise the block positions are drawn independently.
         """
 
         # common
@@ -81,6 +89,14 @@ class ExperienceReplayBuffer(BaseReplayBuffer):
                      "next": "next_obs", "gamma": discount_factor}
         self._n_step = n_step
 
+        # contiguous block sampling
+        assert block_len == 1 or not prioritized, \
+            "block_len > 1 is not supported with prioritized replay buffer"
+        assert block_gap is None or block_gap >= 0, \
+            "block_gap must be a non-negative integer"
+        self._block_len = int(block_len)
+        self._block_gap = block_gap
+
         # PrioritizedReplayBuffer
         self.prioritized = prioritized
         self._beta = beta
@@ -90,6 +106,9 @@ class ExperienceReplayBuffer(BaseReplayBuffer):
                                                    Nstep=Nstep)
         else:
             self._buffer = ReplayBuffer(size, env_dict, Nstep=Nstep)
+        if self._block_len > 1:
+            assert hasattr(self._buffer, "_encode_sample"), \
+                "block sampling requires cpprb.ReplayBuffer._encode_sample"
 
     @check_inputs_shapes
     def store(self, samples, priorities=None):
@@ -112,36 +131,77 @@ class ExperienceReplayBuffer(BaseReplayBuffer):
         assert len(np_states) < self._buffer.get_buffer_size(), \
             "The sample size exceeds the buffer size."
 
-        if self.prioritized and (~np_dones).any():
-            np_priorities = None if priorities is None \
-                else priorities.detach().cpu().numpy()[~np_dones]
-            self._buffer.add(
-                **self._before_add(obs=np_states[~np_dones],
-                                   act=np_actions[~np_dones],
-                                   rew=np_rewards[~np_dones],
-                                   done=np_next_dones[~np_dones],
-                                   next_obs=np_next_states[~np_dones]),
-                priorities=np_priorities)
-
-        # if there is at least one sample to store
-        if not self.prioritized and (~np_dones).any():
-            # remove done==1 by [~np_dones]
-            self._buffer.add(
-                **self._before_add(obs=np_states[~np_dones],
-                                   act=np_actions[~np_dones],
-                                   rew=np_rewards[~np_dones],
-                                   done=np_next_dones[~np_dones],
-                                   next_obs=np_next_states[~np_dones]))
+        np_priorities = None
+        if self.prioritized and priorities is not None:
+            np_priorities = priorities.detach().cpu().numpy()
+
+        # remove done==1 by [~np_dones]
+        not_dones = ~np_dones
+        # if there is no sample to store
+        if not not_dones.any():
+            return
+        # skip the masking copies when all the samples are stored,
+        # e.g. a single transition stored by LazyAgent.act
+        if not not_dones.all():
+            np_states = np_states[not_dones]
+            np_actions = np_actions[not_dones]
+            np_rewards = np_rewards[not_dones]
+            np_next_dones = np_next_dones[not_dones]
+            np_next_states = np_next_states[not_dones]
+            if np_priorities is not None:
+                np_priorities = np_priorities[not_dones]
+
+        kwargs = self._before_add(obs=np_states,
+                                  act=np_actions,
+                                  rew=np_rewards,
+                                  done=np_next_dones,
+                                  next_obs=np_next_states)
+        if self.prioritized:
+            self._buffer.add(**kwargs, priorities=np_priorities)
+        else:
+            self._buffer.add(**kwargs)
 
     def sample(self, batch_size):
         '''Sample from the stored transitions'''
         if self.prioritized:
             npsamples = self._buffer.sample(batch_size, beta=self._beta)
+        elif self._block_len > 1:
+            npsamples = self._sample_indexes(self._block_indexes(batch_size))
         else:
             npsamples = self._buffer.sample(batch_size)
         samples = self.samples_from_cpprb(npsamples)
         return samples
 
+    def _block_indexes(self, batch_size):
+        '''Indexes of batch_size / block_len blocks of consecutive transitions'''
+        stored_size = self._buffer.get_stored_size()
+        block_len = min(self._block_len, stored_size)
+        num_blocks = -(-batch_size // block_len)  # ceil
+        if self._block_gap is None:
+            starts = np.random.randint(0, stored_size - block_len + 1,
+                                       size=num_blocks)
+        else:
+            # draw distinct slots on a grid with a random offset
+            stride = block_len + self._block_gap
+            offset = np.random.randint(
+                min(stride, stored_size - block_len + 1))
+            num_slots = (stored_size - block_len - offset) // stride + 1
+            slots = np.random.choice(num_slots, size=num_blocks,
+                                     replace=num_slots < num_blocks)
+            starts = offset + slots * stride
+        indexes = (starts[:, None] + np.arange(block_len)[None, :]).reshape(-1)
+        if stored_size == self._buffer.get_buffer_size():
+            # the ring buffer is full, so the oldest transition is
+            # at the next write position
+            indexes = (indexes + self._buffer.get_next_index()) % stored_size
+        return indexes[:batch_size]
+
+    def _sample_indexes(self, indexes):
+        '''Gather the transitions at the given positions of the cpprb buffer'''
+        # cpprb has no public API to sample given indexes,
+        # so this depends on the private ReplayBuffer._encode_sample.
+        return self._buffer._encode_sample(indexes)
+
     def update_priorities(self, indexes, td_errors):
         '''Update priorities based on the TD error'''
         if is_debug_mode():
@@ -180,12 +240,14 @@ class ExperienceReplayBuffer(BaseReplayBuffer):
 
         states = State.from_numpy(npsamples["obs"], device=device)
         actions = Action.from_numpy(npsamples["act"], device=device)
-        rewards = torch.tensor(npsamples["rew"], dtype=torch.float32,
-                               device=device).squeeze()
+        # cpprb returns freshly gathered arrays, so they can be shared
+        rewards = torch.as_tensor(npsamples["rew"], dtype=torch.float32,
+                                  device=device).squeeze()
         next_states = State.from_numpy(
             npsamples["next_obs"], npsamples["done"], device=device)
-        if self.prioritized:
-            weights = torch.tensor(
+        # transitions from get_all_transitions() don't have weights
+        if self.prioritized and "weights" in npsamples:
+            weights = torch.as_tensor(
                 npsamples["weights"], dtype=torch.float32, device=self.device)
             indexes = npsamples["indexes"]
         else:
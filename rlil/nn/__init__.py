@@ -4,6 +4,7 @@ from torch.nn import *  # export everthing
 from torch.nn import functional as F
 import numpy as np
 from rlil.environments import State
+from rlil.initializer import use_amp
 
 
 class RLNetwork(nn.Module):
@@ -260,3 +261,14 @@ def mmd_gaussian(samples1, samples2, sigma=10.0):
 def weighted_mse_loss(input, target, weight, reduction='mean'):
     loss = (weight * ((target - input) ** 2))
     return torch.mean(loss) if reduction == 'mean' else torch.sum(loss)
+
+
+def autocast(device):
+    """
+    bfloat16 autocast context on the given device.
+    It does nothing unless rlil.initializer.enable_amp() is called.
+    bfloat16 doesn't need a GradScaler.
+    """
+    return torch.autocast(device_type=torch.device(device).type,
+                          dtype=torch.bfloat16,
+                          enabled=use_amp())
@@ -1,3 +1,4 @@
+import math
 import torch
 import numpy as np
 import torch.nn.functional as F
@@ -32,32 +33,25 @@ class SoftDeterministicPolicyNetwork(RLNetwork):
     def __init__(self, model, space):
         super().__init__(model)
         self._action_dim = space.shape[0]
-        self._tanh_scale = torch.tensor(
+        # buffers are moved by .to(device) together with the parameters
+        self.register_buffer("_tanh_scale", torch.as_tensor(
             (space.high - space.low) / 2,
-            dtype=torch.float32, device=self.device)
-        self._tanh_mean = torch.tensor(
+            dtype=torch.float32, device=self.device), persistent=False)
+        self.register_buffer("_tanh_mean", torch.as_tensor(
             (space.high + space.low) / 2,
-            dtype=torch.float32, device=self.device)
+            dtype=torch.float32, device=self.device), persistent=False)
 
-    def forward(self, state, return_mean=False):
+    def forward(self, state, return_mean=False, generator=None):
         outputs = super().forward(state)
         if return_mean:
             means = outputs[:, 0: self._action_dim]
             means = squash_action(means, self._tanh_scale, self._tanh_mean)
             return means
 
-        # make normal distribution
         means = outputs[:, 0: self._action_dim]
         logvars = outputs[:, self._action_dim:]
-        std = logvars.mul(0.5).exp_()
-        normal = torch.distributions.normal.Normal(means, std)
-
-        # sample from the normal distribution
-        raw = normal.rsample()
-        log_prob = self.compute_log_prob(raw, normal)
-
-        action = squash_action(raw, self._tanh_scale, self._tanh_mean)
-        return action, log_prob
+        return _sample(means, logvars, self._tanh_scale, self._tanh_mean,
+                       generator)
 
     def sample_multiple(self, state, num_sample=10):
         # this function is used in BEAR and BRAC training
@@ -67,10 +61,10 @@ class SoftDeterministicPolicyNetwork(RLNetwork):
         means = outputs[:, 0: self._action_dim]
         repeated_means = torch.repeat_interleave(
             means.unsqueeze(1), num_sample, 1)
-        logvars = outputs[:, self._action_dim:]
-        repeated_logvars = torch.repeat_interleave(
-            logvars.unsqueeze(1), num_sample, 1)
-        repeated_std = repeated_logvars.mul(0.5).exp_()
+        # compute std before repeating it
+        std = outputs[:, self._action_dim:].mul(0.5).exp_()
+        repeated_std = torch.repeat_interleave(
+            std.unsqueeze(1), num_sample, 1)
         # batch x num_sample x d
         normal = torch.distributions.normal.Normal(
             repeated_means, repeated_std)
@@ -79,12 +73,7 @@ class SoftDeterministicPolicyNetwork(RLNetwork):
         return action, raw
 
     def compute_log_prob(self, raw, normal):
-        # see openai spinningup for log_prob computation:
-        # https://github.com/openai/spinningup/blob/e76f3cc1dfbf94fe052a36082dbd724682f0e8fd/spinup/algos/pytorch/sac/core.py#L53
-
-        log_prob = normal.log_prob(raw).sum(axis=-1)
-        log_prob -= (2*(np.log(2) - raw - F.softplus(-2*raw))).sum(axis=-1)
-        return log_prob
+        return _compute_log_prob(raw, normal)
 
     def mean_logvar(self, state):
         outputs = super().forward(state)
@@ -92,7 +81,43 @@ class SoftDeterministicPolicyNetwork(RLNetwork):
         logvars = outputs[:, self._action_dim:]
         return means, logvars
 
-    def to(self, device):
-        self._tanh_mean = self._tanh_mean.to(device)
-        self._tanh_scale = self._tanh_scale.to(device)
-        return super().to(device)
+
+def _compute_log_prob(raw, normal):
+    # see openai spinningup for log_prob computation:
+    # https://github.com/openai/spinningup/blob/e76f3cc1dfbf94fe052a36082dbd724682f0e8fd/spinup/algos/pytorch/sac/core.py#L53
+
+    log_prob = normal.log_prob(raw).sum(axis=-1)
+    log_prob -= (2*(np.log(2) - raw - F.softplus(-2*raw))).sum(axis=-1)
+    return log_prob
+
+
+@torch.jit.script
+def _sample_tail(means: torch.Tensor,
+                 logvars: torch.Tensor,
+                 noise: torch.Tensor,
+                 tanh_scale: torch.Tensor,
+                 tanh_mean: torch.Tensor):
+    # std is computed here so that it is fused with the other pointwise ops
+    half_logvars = 0.5 * logvars
+    # reparameterized sample, the same as Normal(means, std).rsample()
+    raw = means + half_logvars.exp() * noise
+    # Normal(means, std).log_prob(raw) where (raw - means) / std == noise
+    # and log(std) == 0.5 * logvars
+    log_prob = (-0.5 * noise.pow(2) - half_logvars
+                - 0.5 * math.log(2 * math.pi)).sum(-1)
+    # same correction as _compute_log_prob
+    log_prob = log_prob - \
+        (2 * (math.log(2.) - raw - F.softplus(-2 * raw))).sum(-1)
+    action = torch.tanh(raw) * tanh_scale + tanh_mean
+    return action, log_prob
+
+
+def _sample(means, logvars, tanh_scale, tanh_mean, generator=None):
+    # keep the log_prob and the tanh correction in float32 under autocast
+    means, logvars = means.float(), logvars.float()
+    if generator is None:
+        noise = torch.randn_like(means)
+    else:
+        noise = torch.randn(means.shape, generator=generator,
+                            dtype=means.dtype, device=means.device)
+    return _sample_tail(means, logvars, noise, tanh_scale, tanh_mean)
@@ -18,7 +18,9 @@ def airl(
         # Training settings
         minibatch_size=512,
         update_frequency=1,
+        update_batches=1,
         # Replay Buffer settings
+        expert_ratio=0.5,
         replay_start_size=5000,
         replay_buffer_size=1e6
 ):
@@ -34,7 +36,9 @@ def airl(
         lr_r (float): Learning rate for the reward function network.
         lr_v (float): Learning rate for the value function network.
         update_frequency (int): Number of base_agent update per discriminator update.
+        update_batches (int): Number of discriminator minibatches merged into one update.
         minibatch_size (int): Number of experiences to sample in each discriminator update.
+        expert_ratio (float): Fraction of expert experiences in each discriminator update.
         replay_start_size (int): Number of experiences in replay buffer when training begins.
         replay_buffer_size (int): Maximum number of experiences to store in the replay buffer.
     """
@@ -70,7 +74,8 @@ def airl(
                                     value_fn=value_fn,
                                     policy=base_agent.policy,
                                     feature_nw=base_agent.feature_nw,
-                                    discount_factor=discount_factor)
+                                    discount_factor=discount_factor,
+                                    expert_ratio=expert_ratio)
         set_replay_buffer(replay_buffer)
 
         # replace base_agent's replay_buffer with gail_buffer
@@ -80,7 +85,8 @@ def airl(
             base_agent=base_agent,
             minibatch_size=minibatch_size,
             replay_start_size=replay_start_size,
-            update_frequency=update_frequency
+            update_frequency=update_frequency,
+            update_batches=update_batches
         )
     return _airl
 
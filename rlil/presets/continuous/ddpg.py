@@ -27,6 +27,8 @@ def ddpg(
         prioritized=False,
         use_apex=False,
         n_step=1,
+        block_len=1,
+        block_gap=None,
         # Exploration settings
         noise=0.1,
 ):
@@ -44,6 +46,8 @@ def ddpg(
         prioritized (bool): Use prioritized experience replay if True.
         use_apex (bool): Use apex if True.
         n_step (int): Number of steps for N step experience replay.
+        block_len (int): Number of consecutive transitions in each sampled block.
+        block_gap (int): Minimum distance between the sampled blocks.
         noise (float): The amount of exploration noise to add.
     """
     def _ddpg(env):
@@ -72,7 +76,8 @@ def ddpg(
         set_n_step(n_step=n_step, discount_factor=discount_factor)
         replay_buffer = ExperienceReplayBuffer(
             replay_buffer_size, env,
-            prioritized=prioritized or use_apex)
+            prioritized=prioritized or use_apex,
+            block_len=block_len, block_gap=block_gap)
         set_replay_buffer(replay_buffer)
 
         return DDPG(
@@ -15,7 +15,9 @@ def gail(
         # Training settings
         minibatch_size=512,
         update_frequency=1,
+        update_batches=1,
         # Replay Buffer settings
+        expert_ratio=0.5,
         replay_start_size=5000,
         replay_buffer_size=1e6
 ):
@@ -29,7 +31,9 @@ def gail(
             A function generated by a preset of an agent such as sac, td3, ddpg
         lr_d (float): Learning rate for the discriminator network.
         update_frequency (int): Number of base_agent update per discriminator update.
+        update_batches (int): Number of discriminator minibatches merged into one update.
         minibatch_size (int): Number of experiences to sample in each discriminator update.
+        expert_ratio (float): Fraction of expert experiences in each discriminator update.
         replay_start_size (int): Number of experiences in replay buffer when training begins.
         replay_buffer_size (int): Maximum number of experiences to store in the replay buffer.
     """
@@ -53,7 +57,8 @@ def gail(
         replay_buffer = get_replay_buffer()
         replay_buffer = GailWrapper(replay_buffer,
                                     expert_replay_buffer,
-                                    discriminator)
+                                    discriminator,
+                                    expert_ratio=expert_ratio)
         set_replay_buffer(replay_buffer)
 
         # replace base_agent's replay_buffer with gail_buffer
@@ -63,7 +68,8 @@ def gail(
             base_agent=base_agent,
             minibatch_size=minibatch_size,
             replay_start_size=replay_start_size,
-            update_frequency=update_frequency
+            update_frequency=update_frequency,
+            update_batches=update_batches
         )
     return _gail
 
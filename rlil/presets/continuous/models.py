@@ -85,8 +85,7 @@ def fc_discriminator(env, hidden1=400, hidden2=300):
         nn.LeakyReLU(),
         nn.Linear(hidden1, hidden2),
         nn.LeakyReLU(),
-        nn.Linear(hidden2, 1),
-        nn.Sigmoid())
+        nn.Linear(hidden2, 1))
 
 
 def fc_bcq_encoder(env, latent_dim=32, hidden1=400, hidden2=300):
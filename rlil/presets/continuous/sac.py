@@ -28,6 +28,8 @@ def sac(
         prioritized=False,
         use_apex=False,
         n_step=1,
+        block_len=1,
+        block_gap=None,
         # Exploration settings
         temperature_initial=0.1,
         lr_temperature=1e-5,
@@ -48,6 +50,8 @@ def sac(
         prioritized (bool): Use prioritized experience replay if True.
         use_apex (bool): Use apex if True.
         n_step (int): Number of steps for N step experience replay.
+        block_len (int): Number of consecutive transitions in each sampled block.
+        block_gap (int): Minimum distance between the sampled blocks.
         temperature_initial (float): Initial value of the temperature parameter.
         lr_temperature (float): Learning rate for the temperature. Should be low compared to other learning rates.
         entropy_target_scaling (float): The target entropy will be -(entropy_target_scaling * env.action_space.shape[0])
@@ -94,7 +98,8 @@ def sac(
         set_n_step(n_step=n_step, discount_factor=discount_factor)
         replay_buffer = ExperienceReplayBuffer(
             replay_buffer_size, env,
-            prioritized=prioritized or use_apex)
+            prioritized=prioritized or use_apex,
+            block_len=block_len, block_gap=block_gap)
         set_replay_buffer(replay_buffer)
 
         return SAC(
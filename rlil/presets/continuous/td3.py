@@ -29,6 +29,8 @@ def td3(
         prioritized=False,
         use_apex=False,
         n_step=1,
+        block_len=1,
+        block_gap=None,
         # Exploration settings
         noise_policy=0.1,
 ):
@@ -48,6 +50,8 @@ def td3(
         prioritized (bool): Use prioritized experience replay if True.
         use_apex (bool): Use apex if True.
         n_step (int): Number of steps for N step experience replay.
+        block_len (int): Number of consecutive transitions in each sampled block.
+        block_gap (int): Minimum distance between the sampled blocks.
         noise_policy (float): The amount of exploration noise to add.
     """
     def _td3(env):
@@ -86,7 +90,8 @@ def td3(
         set_n_step(n_step=n_step, discount_factor=discount_factor)
         replay_buffer = ExperienceReplayBuffer(
             replay_buffer_size, env,
-            prioritized=prioritized or use_apex)
+            prioritized=prioritized or use_apex,
+            block_len=block_len, block_gap=block_gap)
         set_replay_buffer(replay_buffer)
 
         return TD3(
@@ -1,6 +1,7 @@
 import ray
 import numpy as np
 import os
+import warnings
 import torch
 from rlil.initializer import get_replay_buffer, call_seed
 from rlil.environments import State, Action
@@ -23,11 +24,14 @@ class Worker:
         torch.manual_seed(seed)
         if torch.cuda.is_available():
             torch.cuda.manual_seed_all(seed)
+        # lazy agents sample actions from the worker's own generator
+        self._generator = torch.Generator().manual_seed(seed)
         self._env = make_env()
         self._env.seed(seed)
 
         print("Worker initialized in PID: {}".format(os.getpid()))
 
+    @ray.method(num_returns=2)
     def sample(self, lazy_agent, worker_frames, worker_episodes):
         """
         Args:
@@ -41,11 +45,21 @@ class Worker:
                     frames: the number of frames each episode
                     returns: the return per episode
 
-            (States, Actions, rewards, NextStates)
+            transitions (tuple): (npsamples, np_priorities).
+                It is returned as a separate object so that the caller
+                fetches it only when the samples are stored.
+
+            npsamples (dict of nparrays):
+                Transitions generated by cpprb.ReplayBuffer.get_all_transitions().
+                numpy arrays are passed through ray's object store without
+                pickling, unlike torch tensors.
+
+            np_priorities (nparray or None): priorities of the transitions
         """
 
         sample_info = {"frames": [], "returns": []}
         lazy_agent.set_replay_buffer(self._env)
+        lazy_agent.set_generator(self._generator)
 
         # Sample until it reaches worker_frames or worker_episodes.
         while sum(sample_info["frames"]) < worker_frames \
@@ -66,10 +80,14 @@ class Worker:
             sample_info["frames"].append(_frames)
             sample_info["returns"].append(_return)
 
-        samples = lazy_agent.replay_buffer.get_all_transitions()
-        samples.weights = lazy_agent.compute_priorities(samples)
+        npsamples = lazy_agent.replay_buffer.get_all_transitions(
+            return_cpprb=True)
+        priorities = lazy_agent.compute_priorities(
+            lazy_agent.replay_buffer.samples_from_cpprb(npsamples))
+        np_priorities = None if priorities is None \
+            else priorities.detach().cpu().numpy()
 
-        return sample_info, samples
+        return sample_info, (npsamples, np_priorities)
 
 
 class AsyncSampler(Sampler):
@@ -77,12 +95,22 @@ class AsyncSampler(Sampler):
     AsyncSampler collects samples with asynchronous workers.
     All the workers have the same agent, which is given by the argument
     of the start_sampling method.
+
+    Args:
+        env (rlil.environments.GymEnvironment)
+        num_workers (int): Number of workers
+        pipelining (bool):
+            If True, a finished worker is restarted with the latest
+            lazy_agent before its samples are stored, so that the next
+            rollout overlaps with storing. The samples are collected by
+            a lazy_agent one iteration older. Don't use it for on-policy agents.
     """
 
     def __init__(
             self,
             env,
             num_workers=1,
+            pipelining=False,
     ):
         self._env = env
         seed = call_seed()
@@ -90,6 +118,12 @@ class AsyncSampler(Sampler):
                          for i in range(num_workers)]
         self._work_ids = {worker: None for worker in self._workers}
         self.replay_buffer = get_replay_buffer()
+        self._pipelining = pipelining
+        # arguments of the last start_sampling call
+        self._current_lazy_agent = None
+        self._current_start_info = None
+        self._worker_frames = None
+        self._worker_episodes = None
 
     def start_sampling(self,
                        lazy_agent,
@@ -102,13 +136,25 @@ class AsyncSampler(Sampler):
         assert worker_frames != np.inf or worker_episodes != np.inf, \
             "worker_frames or worker_episodes must be specified"
 
+        self._current_lazy_agent = lazy_agent
+        self._current_start_info = start_info
+        self._worker_frames = worker_frames
+        self._worker_episodes = worker_episodes
+
         # start sample method if the worker is ready
         for worker in self._workers:
             if self._work_ids[worker] is None:
-                self._work_ids[worker] = \
-                    {"id": worker.sample.remote(
-                        lazy_agent, worker_frames, worker_episodes),
-                     "start_info": start_info}
+                self._start_worker(worker)
+
+    def _start_worker(self, worker):
+        info_id, transitions_id = \
+            worker.sample.remote(self._current_lazy_agent,
+                                 self._worker_frames,
+                                 self._worker_episodes)
+        self._work_ids[worker] = \
+            {"id": info_id,
+             "transitions_id": transitions_id,
+             "start_info": self._current_start_info}
 
     def store_samples(self, timeout=-1, evaluation=False):
         # if timeout < 0, wait until the sampling finishes
@@ -116,25 +162,50 @@ class AsyncSampler(Sampler):
         # result is a dict of {start_info: {"frames": [], "returns": []}}
         result = defaultdict(lambda: {"frames": [], "returns": []})
 
-        # store samples when the worker finishes sampling
-        for worker, item in self._work_ids.items():
-            _id = item["id"]
-            start_info = item["start_info"]
-            if timeout > 0:
-                ready_id, remaining_id = \
-                    ray.wait([_id], num_returns=1, timeout=timeout)
+        # wait for all the running workers at once
+        running = {item["id"]: (worker, item)
+                   for worker, item in self._work_ids.items()
+                   if item is not None}
+        ids = list(running.keys())
+        if timeout > 0 and len(ids) > 0:
+            # only check the completion here, the objects are
+            # fetched by ray.get below
+            ready_ids, remaining_ids = \
+                ray.wait(ids, num_returns=len(ids), timeout=timeout,
+                         fetch_local=False)
+        else:
+            ready_ids = ids
+
+        # restart the workers before fetching and storing their samples
+        for _id in ready_ids:
+            worker, _ = running[_id]
+            if self._pipelining and not evaluation:
+                self._start_worker(worker)
             else:
-                ready_id = [_id]
-
-            # if there is at least one finished worker
-            if len(ready_id) > 0:
-                # merge results
-                sample_info, samples = ray.get(ready_id[0])
-                result[start_info]["frames"] += sample_info["frames"]
-                result[start_info]["returns"] += sample_info["returns"]
-
                 self._work_ids[worker] = None
-                if not evaluation:
-                    self.replay_buffer.store(samples, priorities=samples.weights)
+
+        # merge results of the finished workers
+        for _id, sample_info in zip(ready_ids, ray.get(ready_ids)):
+            start_info = running[_id][1]["start_info"]
+            result[start_info]["frames"] += sample_info["frames"]
+            result[start_info]["returns"] += sample_info["returns"]
+
+        # transitions are fetched only when they are stored
+        if not evaluation:
+            transitions_ids = [running[_id][1]["transitions_id"]
+                               for _id in ready_ids]
+            for npsamples, np_priorities in ray.get(transitions_ids):
+                # wrap the arrays without copying them. The arrays in
+                # ray's object store are read-only, but they are only read
+                # until the replay buffer copies them.
+                with warnings.catch_warnings():
+                    warnings.filterwarnings("ignore",
+                                            message=".*not writable.*",
+                                            category=UserWarning)
+                    samples = self.replay_buffer.samples_from_cpprb(
+                        npsamples, device="cpu")
+                priorities = None if np_priorities is None \
+                    else torch.from_numpy(np_priorities)
+                self.replay_buffer.store(samples, priorities=priorities)
 
         return result
@@ -5,7 +5,7 @@ from rlil.environments import GymEnvironment, ENVS
 from rlil.experiments import Experiment
 from rlil.presets import get_default_args
 from rlil.presets import continuous
-from rlil.initializer import get_logger, set_device, set_seed, get_writer
+from rlil.initializer import get_logger, set_device, set_seed, enable_compile, enable_amp, get_writer
 import torch
 import logging
 import ray
@@ -30,6 +30,10 @@ def main():
                         help="Minutes to train.")
     parser.add_argument("--num_workers_eval", type=int,
                         default=1, help="Number of workers for evaluation")
+    parser.add_argument("--compile", action="store_true",
+                        help="Compile the models with torch.compile")
+    parser.add_argument("--amp", action="store_true",
+                        help="Use bfloat16 autocast in the SAC policy and GAIL discriminator")
     parser.add_argument("--exp_info", default="default experiment",
                         help="One line descriptions of the experiment. \
                             Experiments' results are saved in 'runs/[exp_info]/[env_id]/'")
@@ -39,6 +43,10 @@ def main():
     # initialization
     ray.init(include_webui=False, ignore_reinit_error=True)
     set_device(torch.device(args.device))
+    if args.compile:
+        enable_compile()
+    if args.amp:
+        enable_amp()
     set_seed(args.seed)
     logger = get_logger()
     logger.setLevel(logging.DEBUG)
@@ -4,7 +4,7 @@ import pybullet_envs
 from rlil.environments import GymEnvironment, ENVS
 from rlil.experiments import Experiment
 from rlil.presets import get_default_args, continuous
-from rlil.initializer import get_logger, set_device, set_seed
+from rlil.initializer import get_logger, set_device, set_seed, enable_compile, enable_amp
 import torch
 import logging
 import ray
@@ -24,6 +24,13 @@ def main():
                         help="Minutes to train.")
     parser.add_argument("--num_workers", type=int, default=1,
                         help="Number of workers for training")
+    parser.add_argument("--compile", action="store_true",
+                        help="Compile the models with torch.compile")
+    parser.add_argument("--amp", action="store_true",
+                        help="Use bfloat16 autocast in the SAC policy and GAIL discriminator")
+    parser.add_argument("--pipelining", action="store_true",
+                        help="Restart the workers before storing their samples. \
+                            Not supported with on-policy agents.")
     parser.add_argument("--exp_info", default="default experiment",
                         help="One line descriptions of the experiment. \
                             Experiments' results are saved in 'runs/[exp_info]/[env_id]/'")
@@ -33,6 +40,10 @@ def main():
     # initialization
     ray.init(include_webui=False, ignore_reinit_error=True)
     set_device(torch.device(args.device))
+    if args.compile:
+        enable_compile()
+    if args.amp:
+        enable_amp()
     set_seed(args.seed)
     logger = get_logger()
     logger.setLevel(logging.DEBUG)
@@ -58,6 +69,7 @@ def main():
     Experiment(
         agent_fn, env,
         num_workers=args.num_workers,
+        pipelining=args.pipelining,
         train_minutes=args.train_minutes,
         args_dict=args_dict,
         seed=args.seed,
@@ -0,0 +1,56 @@
+import pytest
+from torch.optim import Adam
+from rlil.agents import AIRL
+from rlil.environments import GymEnvironment
+from rlil.memory import AirlWrapper
+from rlil.presets.continuous.models import fc_reward, fc_v, fc_actor_critic
+from rlil.policies import GaussianPolicy
+from rlil.approximation import Approximation, FeatureNetwork, VNetwork
+from rlil.initializer import set_replay_buffer
+from ..mock_agent import MockBaseAgent
+from .mock_buffer import make_buffer, record_sample_both
+
+
+@pytest.fixture
+def setUp(use_cpu):
+    env = GymEnvironment('LunarLanderContinuous-v2', append_time=True)
+
+    reward_model = fc_reward(env)
+    reward_fn = Approximation(reward_model, Adam(reward_model.parameters()))
+    value_model = fc_v(env)
+    value_fn = VNetwork(value_model, Adam(value_model.parameters()))
+
+    feature_model, _, policy_model = fc_actor_critic(env)
+    feature_nw = FeatureNetwork(feature_model,
+                                Adam(feature_model.parameters()))
+    policy = GaussianPolicy(policy_model,
+                            Adam(policy_model.parameters()),
+                            env.action_space)
+
+    airl_buffer = AirlWrapper(make_buffer(env),
+                              make_buffer(env),
+                              reward_fn,
+                              value_fn,
+                              policy,
+                              feature_nw=feature_nw)
+    set_replay_buffer(airl_buffer)
+    yield airl_buffer
+
+
+@pytest.mark.parametrize("update_batches, num_updates", [(1, 20), (4, 5)])
+def test_update_batches(setUp, update_batches, num_updates):
+    sampled = record_sample_both(setUp)
+    base_agent = MockBaseAgent()
+    agent = AIRL(base_agent,
+                 minibatch_size=32,
+                 replay_start_size=0,
+                 update_frequency=1,
+                 update_batches=update_batches)
+    for _ in range(20):
+        agent.train()
+
+    assert base_agent.train_count == 20
+    assert len(sampled) == num_updates
+    for samples, expert_samples in sampled:
+        assert len(samples.states) == 16 * update_batches
+        assert len(expert_samples.states) == 16 * update_batches
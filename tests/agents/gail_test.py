@@ -0,0 +1,102 @@
+import pytest
+import torch
+from torch.optim import Adam
+import torch_testing as tt
+from rlil import nn
+from rlil.agents import GAIL
+from rlil.environments import GymEnvironment
+from rlil.memory import GailWrapper
+from rlil.presets.continuous.models import fc_discriminator
+from rlil.approximation import Discriminator
+from rlil.initializer import set_replay_buffer, enable_amp, disable_amp
+from ..mock_agent import MockBaseAgent
+from .mock_buffer import make_buffer, record_sample_both
+
+
+@pytest.fixture
+def setUp(use_cpu):
+    env = GymEnvironment('LunarLanderContinuous-v2', append_time=True)
+    discriminator_model = fc_discriminator(env)
+    discriminator_optimizer = Adam(discriminator_model.parameters())
+    discriminator = Discriminator(discriminator_model,
+                                  discriminator_optimizer)
+
+    gail_buffer = GailWrapper(make_buffer(env),
+                              make_buffer(env),
+                              discriminator)
+    set_replay_buffer(gail_buffer)
+    yield gail_buffer
+
+
+@pytest.mark.parametrize("update_batches, num_updates", [(1, 20), (4, 5)])
+def test_update_batches(setUp, update_batches, num_updates):
+    sampled = record_sample_both(setUp)
+    base_agent = MockBaseAgent()
+    agent = GAIL(base_agent,
+                 minibatch_size=32,
+                 replay_start_size=0,
+                 update_frequency=1,
+                 update_batches=update_batches)
+    for _ in range(20):
+        agent.train()
+
+    assert base_agent.train_count == 20
+    assert len(sampled) == num_updates
+    for samples, expert_samples in sampled:
+        assert len(samples.states) == 16 * update_batches
+        assert len(expert_samples.states) == 16 * update_batches
+
+
+@pytest.mark.parametrize("expert_ratio", [0.5, 0.25])
+def test_discrim_loss(setUp, expert_ratio):
+    replay_buffer = setUp
+    replay_buffer.expert_ratio = expert_ratio
+    agent = GAIL(MockBaseAgent(),
+                 minibatch_size=32,
+                 replay_start_size=0,
+                 update_frequency=1)
+
+    # capture the samples and the loss of a discriminator update
+    sampled = record_sample_both(replay_buffer)
+    losses = []
+    agent.discriminator.reinforce = losses.append
+    agent.train()
+
+    samples, expert_samples = sampled[0]
+    assert len(expert_samples.states) == int(round(32 * expert_ratio))
+    fake = agent.discriminator(
+        torch.cat((samples.states.features, samples.actions.features), 1))
+    real = agent.discriminator(
+        torch.cat((expert_samples.states.features,
+                   expert_samples.actions.features), 1))
+    criterion = nn.BCEWithLogitsLoss()
+    expected = criterion(fake, torch.ones_like(fake)) + \
+        criterion(real, torch.zeros_like(real))
+    tt.assert_almost_equal(losses[0], expected, decimal=5)
+
+
+def test_amp(setUp):
+    agent = GAIL(MockBaseAgent(),
+                 minibatch_size=32,
+                 replay_start_size=0,
+                 update_frequency=1)
+    param = next(agent.discriminator.model.parameters()).clone()
+
+    losses = []
+    reinforce = agent.discriminator.reinforce
+
+    def _reinforce(loss):
+        losses.append(loss)
+        reinforce(loss)
+
+    agent.discriminator.reinforce = _reinforce
+    enable_amp()
+    try:
+        agent.train()
+    finally:
+        disable_amp()
+
+    assert losses[0].dtype == torch.float32
+    assert torch.isfinite(losses[0])
+    assert not torch.equal(param,
+                           next(agent.discriminator.model.parameters()))
@@ -0,0 +1,26 @@
+import torch
+from rlil.environments import State, Action
+from rlil.memory import ExperienceReplayBuffer
+from rlil.utils import Samples
+
+
+def make_buffer(env):
+    replay_buffer = ExperienceReplayBuffer(1000, env)
+    states = State(torch.randn(100, env.state_space.shape[0]))
+    actions = Action(torch.rand(99, env.action_space.shape[0]) * 2 - 1)
+    rewards = torch.zeros(99)
+    replay_buffer.store(Samples(states[:-1], actions, rewards, states[1:]))
+    return replay_buffer
+
+
+def record_sample_both(replay_buffer):
+    # record the results of the sample_both calls
+    results = []
+    sample_both = replay_buffer.sample_both
+
+    def _sample_both(batch_size):
+        results.append(sample_both(batch_size))
+        return results[-1]
+
+    replay_buffer.sample_both = _sample_both
+    return results
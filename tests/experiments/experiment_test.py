@@ -94,5 +94,38 @@ def test_writes_returns_eps():
     )
 
 
+class SamplerExperiment(Experiment):
+    # Experiment with a MockWriter, which keeps the samplers
+    # instead of training the agent
+    def __init__(self, *args, log_dir=None, **kwargs):
+        self._log_dir = log_dir
+        super().__init__(*args, **kwargs)
+
+    def _make_writer(self, agent_name, env_name, exp_info):
+        self._writer = MockWriter(agent_name + '_' + env_name)
+        self._writer.log_dir = self._log_dir
+        return self._writer
+
+
+class MockTrainer:
+    def __init__(self, agent, sampler, eval_sampler, **kwargs):
+        MockTrainer.sampler = sampler
+        MockTrainer.eval_sampler = eval_sampler
+
+    def start_training(self):
+        pass
+
+
+@pytest.mark.parametrize("pipelining", [False, True])
+def test_pipelining(tmp_path, monkeypatch, pipelining):
+    ray.init(include_webui=False, ignore_reinit_error=True)
+    monkeypatch.setattr("rlil.experiments.experiment.Trainer", MockTrainer)
+    env = GymEnvironment('Pendulum-v0', append_time=True)
+    SamplerExperiment(sac(), env, pipelining=pipelining,
+                      log_dir=str(tmp_path))
+    assert MockTrainer.sampler._pipelining == pipelining
+    assert not MockTrainer.eval_sampler._pipelining
+
+
 if __name__ == "__main__":
     unittest.main()
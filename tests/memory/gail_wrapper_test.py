@@ -73,6 +73,28 @@ def test_sample(setUp):
 def test_sample_both(setUp):
     gail_buffer, samples = setUp
     samples, expert_samples = gail_buffer.sample_both(4)
+    assert len(samples.states) == 2
+    assert len(expert_samples.states) == 2
+
+    gail_buffer.expert_ratio = 0.25
+    samples, expert_samples = gail_buffer.sample_both(8)
+    assert len(samples.states) == 6
+    assert len(expert_samples.states) == 2
+
+
+def test_expert_ratio(setUp):
+    gail_buffer, _ = setUp
+    for expert_ratio in [0.0, 1.0]:
+        with pytest.raises(AssertionError):
+            GailWrapper(gail_buffer.buffer,
+                        gail_buffer.expert_buffer,
+                        gail_buffer.discriminator,
+                        expert_ratio=expert_ratio)
+
+    # round(2 * 0.1) = 0 expert samples
+    gail_buffer.expert_ratio = 0.1
+    with pytest.raises(AssertionError):
+        gail_buffer.sample_both_sizes(2)
 
 
 def test_store(setUp):
@@ -125,3 +125,42 @@ def test_per_run():
     (s, a, r, n, w, i) = replay_buffer.sample(3)
     assert r.sum() < 3
     assert w.sum() == 3.
+
+
+def test_block_sample():
+    env = GymEnvironment('LunarLanderContinuous-v2', append_time=True)
+    replay_buffer = ExperienceReplayBuffer(10, env, block_len=4)
+
+    # fill the ring buffer so that the write position wraps around
+    for start in [0, 8]:
+        states = State(torch.tensor([env.observation_space.sample()]*9))
+        actions = Action(torch.tensor([env.action_space.sample()]*8))
+        rewards = torch.arange(start, start + 8, dtype=torch.float)
+        samples = Samples(states[:-1], actions, rewards, states[1:])
+        replay_buffer.store(samples)
+
+    (s, a, r, n, w, i) = replay_buffer.sample(8)
+    assert r.shape == (8, )
+    # each block has consecutive transitions
+    blocks = r.cpu().reshape(2, 4)
+    tt.assert_equal(blocks[:, 1:] - blocks[:, :-1], torch.ones(2, 3))
+    assert r.min() >= 6
+
+
+def test_block_gap_sample():
+    env = GymEnvironment('LunarLanderContinuous-v2', append_time=True)
+    replay_buffer = ExperienceReplayBuffer(30, env, block_len=2, block_gap=3)
+
+    states = State(torch.tensor([env.observation_space.sample()]*21))
+    actions = Action(torch.tensor([env.action_space.sample()]*20))
+    rewards = torch.arange(0, 20, dtype=torch.float)
+    samples = Samples(states[:-1], actions, rewards, states[1:])
+    replay_buffer.store(samples)
+
+    for _ in range(10):
+        (s, a, r, n, w, i) = replay_buffer.sample(6)
+        blocks = r.cpu().reshape(3, 2)
+        tt.assert_equal(blocks[:, 1] - blocks[:, 0], torch.ones(3))
+        # the blocks are at least block_gap transitions apart
+        starts = blocks[:, 0].sort()[0]
+        assert ((starts[1:] - starts[:-1]) >= 5).all()
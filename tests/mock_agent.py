@@ -56,6 +56,9 @@ class MockLazyAgent:
             1e7, env, n_step=self._n_step,
             discount_factor=self._discount_factor)
 
+    def set_generator(self, generator):
+        pass
+
     def act(self, state, reward):
         samples = Samples(self._state, self._action, reward, state)
         self.replay_buffer.store(samples)
@@ -70,3 +73,12 @@ class MockLazyAgent:
 
     def compute_priorities(self, samples):
         return None
+
+
+class MockBaseAgent:
+    # base_agent of GAIL and AIRL counting the train calls
+    def __init__(self):
+        self.train_count = 0
+
+    def train(self):
+        self.train_count += 1
@@ -6,6 +6,9 @@ import torch_testing as tt
 from gym.spaces import Box
 from rlil.environments import State
 from rlil.policies import SoftDeterministicPolicy
+from rlil.nn import autocast
+from rlil.initializer import (enable_compile, disable_compile,
+                              enable_amp, disable_amp)
 
 STATE_DIM = 2
 ACTION_DIM = 3
@@ -52,3 +55,44 @@ def test_sample_multiple(setUp):
     actions, raw_actions = policy.sample_multiple(state, num_sample=10)
     assert actions.shape == (5, 10, ACTION_DIM)
     assert raw_actions.shape == (5, 10, ACTION_DIM)
+
+
+def test_compile(setUp):
+    if not hasattr(torch, "compile"):
+        pytest.skip("torch.compile is not available")
+    policy = setUp
+    state = State(torch.randn(5, STATE_DIM))
+    enable_compile()
+    try:
+        action, log_prob = policy(state)
+    finally:
+        disable_compile()
+    assert action.shape == (5, ACTION_DIM)
+    assert log_prob.shape == (5, )
+
+
+def test_amp(setUp):
+    policy = setUp
+    state = State(torch.randn(5, STATE_DIM))
+    param = next(policy.model.parameters()).clone()
+    enable_amp()
+    try:
+        with autocast("cpu"):
+            # matmuls run in bfloat16
+            assert torch.ones(2, 2).mm(torch.ones(2, 2)).dtype == \
+                torch.bfloat16
+            action, log_prob = policy(state)
+        policy.reinforce(-log_prob.mean())
+    finally:
+        disable_amp()
+    assert action.dtype == torch.float32
+    assert log_prob.dtype == torch.float32
+    assert not torch.equal(param, next(policy.model.parameters()))
+
+
+def test_generator(setUp):
+    policy = setUp
+    state = State(torch.randn(5, STATE_DIM))
+    action1, _ = policy.model(state, generator=torch.Generator().manual_seed(0))
+    action2, _ = policy.model(state, generator=torch.Generator().manual_seed(0))
+    tt.assert_equal(action1, action2)
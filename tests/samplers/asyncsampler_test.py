@@ -118,3 +118,28 @@ def test_eval_sampler(setUp):
     assert len(sampler.replay_buffer) == 0
 
     result["info_list"]
+
+
+def test_pipelining(setUp):
+    env = setUp["env"]
+    agent = setUp["agent"]
+    num_workers = 2
+    worker_episodes = 2
+    sampler = AsyncSampler(
+        env,
+        num_workers=num_workers,
+        pipelining=True
+    )
+
+    for _ in range(3):
+        lazy_agent = agent.make_lazy_agent()
+        sampler.start_sampling(
+            lazy_agent, worker_episodes=worker_episodes)
+        sample_result = sampler.store_samples(timeout=1e8)
+        assert len(sample_result[StartInfo()]["frames"]
+                   ) == num_workers * worker_episodes
+
+    # GIVEN the sampler with pipelining
+    # WHEN store_samples finishes
+    # THEN all the workers have already started the next sampling
+    assert all(item is not None for item in sampler._work_ids.values())